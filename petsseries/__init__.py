@@ -3,5 +3,6 @@ PetsSeriesClient module.
 """
 
 from .api import PetsSeriesClient
+from .circuit_breaker import ServiceUnavailableError
 
-__all__ = ["PetsSeriesClient"]
+__all__ = ["PetsSeriesClient", "ServiceUnavailableError"]
@@ -5,21 +5,39 @@ This module provides the PetsSeriesClient class, which handles authentication,
 data retrieval, and device management for the PetsSeries application.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+from operator import itemgetter
+from typing import Any, AsyncContextManager, Dict, List, Optional, Tuple, Union
 
 import aiohttp
+from multidict import CIMultiDict
+from yarl import URL
 
-from .auth import AuthManager
+from .auth import AuthManager, TOKEN_HEADERS
 from .models import (
     User,
     Home,
     Device,
     Consumer,
+    Meal,
     ModeDevice,
+    Event,
 )
 from .config import Config
-from .session import create_ssl_context
+from .session import (
+    ACCEPT_ENCODING,
+    create_session,
+    handle_unexpected_response,
+    home_url,
+    json_dumps,
+    log_request_errors,
+    warm_up_connection,
+)
+from .transport import ApiTransport
 
 # Import MealsManager
 from .meals import MealsManager
@@ -34,9 +52,57 @@ except ImportError:
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long (in seconds) rarely changing account data is served from the cache
+_ACCOUNT_CACHE_TTL = 300.0
+_HOMES_CACHE_TTL = 60.0
+# Short enough to pick up changes made elsewhere, long enough for back-to-back toggles
+_MODE_DEVICES_CACHE_TTL = 5.0
+
+# Pre-encoded request bodies for the common on/off device settings
+_BOOL_SETTING_BODIES = {
+    (key, value): json_dumps({"settings": {key: {"value": value}}})
+    for key in ("device_active", "push_notification_motion")
+    for value in (False, True)
+}
+
+# JSON keys in the positional order of the corresponding dataclass fields
+_HOME_KEYS = itemgetter(
+    "id", "name", "shared", "numberOfDevices", "externalId", "numberOfActivities"
+)
+_DEVICE_KEYS = itemgetter(
+    "id",
+    "name",
+    "productCtn",
+    "productId",
+    "externalId",
+    "url",
+    "settingsUrl",
+    "subscriptionUrl",
+)
+_MODE_DEVICE_KEYS = itemgetter("id", "name", "settings")
+
+# Seconds before the token expires at which it is no longer trusted without a check
+_TOKEN_EXPIRY_MARGIN = 30.0
+
+
+class ResponseCache(Dict[str, Tuple[float, Any]]):
+    """Decoded API responses by key, each stored with its monotonic expiry time."""
+
+    async def get_or_fetch(
+        self, key: str, ttl: float, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for key, calling fetch when missing or stale."""
+        now = time.monotonic()
+        entry = self.get(key)
+        if entry is not None and now < entry[0]:
+            return entry[1]
+        value = await fetch()
+        self[key] = (now + ttl, value)
+        return value
+
 
 class PetsSeriesClient:
-    # pylint: disable=too-many-public-methods
+    # pylint: disable=too-many-public-methods,too-many-instance-attributes
     """
     Client for interacting with the PetsSeries API.
 
@@ -50,13 +116,36 @@ class PetsSeriesClient:
         access_token=None,
         refresh_token=None,
         tuya_credentials: Optional[Dict[str, str]] = None,
+        *,
+        config: Optional[Config] = None,
     ):
         self.auth = AuthManager(token_file, access_token, refresh_token)
         self.session = None
-        self.headers = {}
-        self.headers_token = {}
+        self.headers: CIMultiDict[str] = CIMultiDict(
+            {
+                "Accept": "application/json",
+                "Accept-Encoding": ACCEPT_ENCODING,
+                "Connection": "keep-alive",
+                "User-Agent": "UnofficialPetsSeriesClient/1.0",
+            }
+        )
+        # Variant for device settings updates, which declare a UTF-8 JSON body
+        self.headers_patch: CIMultiDict[str] = self.headers.copy()
+        self.headers_patch["Content-Type"] = "application/json; charset=UTF-8"
+        # Kept for compatibility; a copy of the headers AuthManager sends
+        self.headers_token: CIMultiDict[str] = TOKEN_HEADERS.copy()
         self.timeout = aiohttp.ClientTimeout(total=10.0)
-        self.config = Config()
+        self._refresh_lock = asyncio.Lock()
+        self._session_lock = asyncio.Lock()
+        self._token_expiry_monotonic: float = 0.0
+        self._cache = ResponseCache()
+        self.config = config or Config()
+        self._transport = ApiTransport(
+            self.config, self.get_authorized_session, self.headers
+        )
+        self.breaker = self._transport.breaker
+        # Parsed once for all requests, including those of the meals and events managers
+        self.homes_api = URL(self.config.homes_api_url)
         self.tuya_client: Optional[TuyaClient] = None  # type: ignore
         self.meals = MealsManager(self)
         self.events = EventsManager(self)
@@ -82,19 +171,23 @@ class PetsSeriesClient:
                 raise
 
     async def get_client(self) -> aiohttp.ClientSession:
-        # pylint: disable=duplicate-code
         """
         Get an aiohttp.ClientSession with certifi's CA bundle.
 
-        Initializes the session if it doesn't exist.
+        Initializes the session if it doesn't exist; see session.create_session.
+        Concurrent callers share the single session created by the first one.
         """
-        if self.session is None:
-            ssl_context = await create_ssl_context()
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            self.session = aiohttp.ClientSession(
-                timeout=self.timeout, connector=connector
-            )
-            _LOGGER.debug("aiohttp.ClientSession initialized with certifi CA bundle.")
+        if self.session is not None:
+            return self.session
+        async with self._session_lock:
+            if self.session is None:
+                session = await create_session(self.config, self.timeout)
+                _LOGGER.debug(
+                    "aiohttp.ClientSession initialized with certifi CA bundle."
+                )
+                # Token refreshes reuse the same connection pool
+                await self.auth.set_session(session)
+                self.session = session
         return self.session
 
     async def initialize(self) -> None:
@@ -108,26 +201,22 @@ class PetsSeriesClient:
             _LOGGER.info("Access token expired, refreshing...")
             await self.auth.refresh_access_token()
         await self._refresh_headers()
+        await warm_up_connection(
+            await self.get_client(), self.config.base_url, self.headers
+        )
 
     async def _refresh_headers(self) -> None:
         """
-        Refresh the headers with the latest access token.
+        Refresh the Authorization headers with the latest access token.
         """
         access_token = await self.auth.get_access_token()
-        self.headers = {
-            "Accept-Encoding": "gzip",
-            "Authorization": f"Bearer {access_token}",
-            "Connection": "keep-alive",
-            "User-Agent": "UnofficialPetsSeriesClient/1.0",
-        }
-        self.headers_token = {
-            "Accept-Encoding": "gzip",
-            "Accept": "application/json",
-            "Connection": "keep-alive",
-            "Host": "cdc.accounts.home.id",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "User-Agent": "Dalvik/2.1.0 (Linux; U; Android 14)",
-        }
+        expiration = await self.auth.get_expiration()
+        self._token_expiry_monotonic = (
+            time.monotonic() + (expiration - time.time()) - _TOKEN_EXPIRY_MARGIN
+        )
+        authorization = f"Bearer {access_token}"
+        self.headers["Authorization"] = authorization
+        self.headers_patch["Authorization"] = authorization
         _LOGGER.debug("Headers refreshed successfully.")
 
     async def close(self) -> None:
@@ -138,157 +227,166 @@ class PetsSeriesClient:
             await self.session.close()
             self.session = None
             _LOGGER.debug("aiohttp.ClientSession closed.")
+        self.invalidate_cache()
         await self.auth.close()
 
+    def invalidate_cache(self) -> None:
+        """
+        Drop all cached API responses so they are fetched again on next use.
+        """
+        self._cache.clear()
+
     async def ensure_token_valid(self) -> None:
         """
         Ensure the access token is valid, refreshing it if necessary.
-        """
-        if await self.auth.is_token_expired():
-            _LOGGER.info("Access token expired, refreshing...")
-            await self.auth.refresh_access_token()
+
+        The token's expiry is cached as a monotonic deadline, so no check is
+        needed until it comes close; once it has passed, the token is refreshed
+        ahead of its actual expiry. Concurrent callers share a single refresh.
+        """
+        if time.monotonic() < self._token_expiry_monotonic:
+            return
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if time.monotonic() < self._token_expiry_monotonic:
+                return
+            # Without a deadline the headers were never set up, so only refresh
+            # a token that has actually expired
+            if self._token_expiry_monotonic or await self.auth.is_token_expired():
+                _LOGGER.info("Access token about to expire, refreshing...")
+                await self.auth.refresh_access_token()
             await self._refresh_headers()
 
+    async def get_authorized_session(self) -> aiohttp.ClientSession:
+        """
+        Ensure the access token is valid and return the aiohttp.ClientSession.
+
+        While the session exists and the token is not close to expiring, this
+        returns straight away without awaiting anything.
+        """
+        session = self.session
+        if session is not None and time.monotonic() < self._token_expiry_monotonic:
+            return session
+        await self.ensure_token_valid()
+        return await self.get_client()
+
+    def request(
+        self, method: str, url: Union[str, URL], **kwargs: Any
+    ) -> AsyncContextManager[aiohttp.ClientResponse]:
+        """
+        Perform an authenticated API request; use as ``async with``.
+
+        Keyword arguments are passed on to aiohttp; headers default to the
+        client's headers. See ApiTransport.request for the concurrency limit
+        and circuit breaker.
+
+        Raises:
+            ServiceUnavailableError: If the circuit breaker is open.
+        """
+        return self._transport.request(method, url, **kwargs)
+
+    async def get_json(self, url: Union[str, URL]) -> Any:
+        """
+        Perform an authenticated GET request and return the decoded JSON body.
+
+        Transient failures are retried; see ApiTransport.get_json.
+
+        Raises:
+            aiohttp.ClientResponseError: If the HTTP request fails.
+            ServiceUnavailableError: If the circuit breaker is open.
+        """
+        with log_request_errors(_LOGGER, "get %s", url):
+            return await self._transport.get_json(url)
+
     async def get_user_info(self) -> User:
         """
         Get user information from the UserInfo endpoint.
+
+        The result is cached for a few minutes; see invalidate_cache.
         """
-        await self.ensure_token_valid()
-        session = await self.get_client()
-        try:
-            async with session.get(
-                self.config.user_info_url, headers=self.headers
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                return User(
-                    sub=data["sub"],
-                    name=data["name"],
-                    given_name=data["given_name"],
-                    picture=data.get("picture"),
-                    locale=data.get("locale"),
-                    email=data["email"],
-                )
-        except aiohttp.ClientResponseError as e:
-            _LOGGER.error("Failed to get user info: %s %s", e.status, e.message)
-            raise
-        except Exception as e:
-            _LOGGER.error("Unexpected error in get_user_info: %s", e)
-            raise
+        return await self._cache.get_or_fetch(
+            "user_info", _ACCOUNT_CACHE_TTL, self._fetch_user_info
+        )
+
+    async def _fetch_user_info(self) -> User:
+        data = await self.get_json(self.config.user_info_url)
+        return User(
+            sub=data["sub"],
+            name=data["name"],
+            given_name=data["given_name"],
+            picture=data.get("picture"),
+            locale=data.get("locale"),
+            email=data["email"],
+        )
 
     async def get_consumer(self) -> Consumer:
         """
         Get Consumer information from the Consumer endpoint.
+
+        The result is cached for a few minutes; see invalidate_cache.
         """
-        await self.ensure_token_valid()
-        session = await self.get_client()
-        try:
-            async with session.get(
-                self.config.consumer_url, headers=self.headers
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                return Consumer(
-                    id=data["id"], country_code=data["countryCode"], url=data["url"]
-                )
-        except aiohttp.ClientResponseError as e:
-            _LOGGER.error("Failed to get Consumer: %s %s", e.status, e.message)
-            raise
-        except Exception as e:
-            _LOGGER.error("Unexpected error in get_consumer: %s", e)
-            raise
+        return await self._cache.get_or_fetch(
+            "consumer", _ACCOUNT_CACHE_TTL, self._fetch_consumer
+        )
+
+    async def _fetch_consumer(self) -> Consumer:
+        data = await self.get_json(self.config.consumer_url)
+        return Consumer(
+            id=data["id"], country_code=data["countryCode"], url=data["url"]
+        )
 
     async def get_homes(self) -> list[Home]:
         """
         Get available homes for the user.
+
+        The result is cached for a minute; see invalidate_cache. The returned
+        list is a copy, but the Home objects are shared and must not be modified.
         """
-        await self.ensure_token_valid()
-        session = await self.get_client()
-        try:
-            async with session.get(
-                self.config.homes_url, headers=self.headers
-            ) as response:
-                response.raise_for_status()
-                homes_data = await response.json()
-                homes = [
-                    Home(
-                        id=home["id"],
-                        name=home["name"],
-                        shared=home["shared"],
-                        number_of_devices=home["numberOfDevices"],
-                        external_id=home["externalId"],
-                        number_of_activities=home["numberOfActivities"],
-                    )
-                    for home in homes_data
-                ]
-                return homes
-        except aiohttp.ClientResponseError as e:
-            _LOGGER.error("Failed to get homes: %s %s", e.status, e.message)
-            raise
-        except Exception as e:
-            _LOGGER.error("Unexpected error in get_homes: %s", e)
-            raise
+        return list(
+            await self._cache.get_or_fetch("homes", _HOMES_CACHE_TTL, self._fetch_homes)
+        )
+
+    async def _fetch_homes(self) -> list[Home]:
+        homes_data = await self.get_json(self.config.homes_url)
+        return [Home(*_HOME_KEYS(home)) for home in homes_data]
 
     async def get_devices(self, home: Home) -> list[Device]:
         """
         Get devices for the selected home.
         """
-        await self.ensure_token_valid()
-        url = (
-            f"https://petsseries-backend.prod.eu-hs.iot.versuni.com/"
-            f"api/homes/{home.id}/devices"
-        )
-        session = await self.get_client()
-        try:
-            async with session.get(url, headers=self.headers) as response:
-                response.raise_for_status()
-                devices_data = await response.json()
-                devices = [
-                    Device(
-                        id=device["id"],
-                        name=device["name"],
-                        product_ctn=device["productCtn"],
-                        product_id=device["productId"],
-                        external_id=device["externalId"],
-                        url=device["url"],
-                        settings_url=device["settingsUrl"],
-                        subscription_url=device["subscriptionUrl"],
-                    )
-                    for device in devices_data.get("item", [])
-                ]
-                return devices
-        except aiohttp.ClientResponseError as e:
-            _LOGGER.error("Failed to get devices: %s %s", e.status, e.message)
-            raise
-        except Exception as e:
-            _LOGGER.error("Unexpected error in get_devices: %s", e)
-            raise
-
-    async def get_mode_devices(self, home: Home) -> list[ModeDevice]:
+        devices_data = await self.get_json(home_url(self.homes_api, home.id, "devices"))
+        return [
+            Device(*_DEVICE_KEYS(device)) for device in devices_data.get("item", [])
+        ]
+
+    async def get_mode_devices(
+        self, home: Home, force_refresh: bool = False
+    ) -> list[ModeDevice]:
         """
         Get mode devices for the selected home.
-        """
-        await self.ensure_token_valid()
-        url = (
-            f"https://petsseries-backend.prod.eu-hs.iot.versuni.com/"
-            f"api/homes/{home.id}/modes/home/devices"
+
+        The result is cached for a few seconds so that reading and then changing
+        a setting costs a single GET; pass force_refresh=True to bypass it.
+        The returned list is a copy, but the ModeDevice objects and their
+        settings are shared and must not be modified.
+        """
+        key = f"mode_devices:{home.id}"
+        if force_refresh:
+            self._cache.pop(key, None)
+        return list(
+            await self._cache.get_or_fetch(
+                key, _MODE_DEVICES_CACHE_TTL, partial(self._fetch_mode_devices, home)
+            )
         )
-        session = await self.get_client()
-        try:
-            async with session.get(url, headers=self.headers) as response:
-                response.raise_for_status()
-                mode_devices_data = await response.json()
-                mode_devices = [
-                    ModeDevice(id=md["id"], name=md["name"], settings=md["settings"])
-                    for md in mode_devices_data.get("item", [])
-                ]
-                return mode_devices
-        except aiohttp.ClientResponseError as e:
-            _LOGGER.error("Failed to get mode devices: %s %s", e.status, e.message)
-            raise
-        except Exception as e:
-            _LOGGER.error("Unexpected error in get_mode_devices: %s", e)
-            raise
+
+    async def _fetch_mode_devices(self, home: Home) -> list[ModeDevice]:
+        mode_devices_data = await self.get_json(
+            home_url(self.homes_api, home.id, "modes/home/devices")
+        )
+        return [
+            ModeDevice(*_MODE_DEVICE_KEYS(md))
+            for md in mode_devices_data.get("item", [])
+        ]
 
     async def update_device_settings(
         self, home: Home, device_id: str, settings: dict
@@ -296,36 +394,27 @@ class PetsSeriesClient:
         """
         Update the settings for a device.
         """
-        await self.ensure_token_valid()
-        url = (
-            f"https://petsseries-backend.prod.eu-hs.iot.versuni.com/"
-            f"api/homes/{home.id}/modes/home/devices/{device_id}"
+        return await self._patch_device_settings(
+            home, device_id, json_dumps({"settings": settings})
         )
 
-        headers = {
-            **self.headers,
-            "Content-Type": "application/json; charset=UTF-8",
-        }
-
-        payload = {"settings": settings}
-        session = await self.get_client()
-        try:
-            async with session.patch(url, headers=headers, json=payload) as response:
+    async def _patch_device_settings(
+        self, home: Home, device_id: str, body: bytes
+    ) -> bool:
+        """
+        Send an already encoded settings update for a device.
+        """
+        url = home_url(self.homes_api, home.id, "modes/home/devices", device_id)
+        with log_request_errors(_LOGGER, "update settings of device %s", device_id):
+            async with self.request(
+                "PATCH", url, headers=self.headers_patch, data=body
+            ) as response:
                 if response.status == 204:
                     _LOGGER.info("Device %s settings updated successfully.", device_id)
+                    self._cache.pop(f"mode_devices:{home.id}", None)
                     return True
 
-                text = await response.text()
-                _LOGGER.error("Failed to update device settings: %s", text)
-                response.raise_for_status()
-        except aiohttp.ClientResponseError as e:
-            _LOGGER.error(
-                "Failed to update device settings: %s %s", e.status, e.message
-            )
-            raise
-        except Exception as e:
-            _LOGGER.error("Unexpected error in update_device_settings: %s", e)
-            raise
+                await handle_unexpected_response(_LOGGER, response)
         return False
 
     async def get_settings(self, home: Home, device_id: str) -> dict:
@@ -347,73 +436,178 @@ class PetsSeriesClient:
         _LOGGER.warning("No settings found for device %s", device_id)
         raise ValueError(f"Device with ID {device_id} not found")
 
+    async def _set_bool_setting(
+        self, home: Home, device_id: str, key: str, value: bool
+    ) -> bool:
+        """
+        Set a boolean setting of a device.
+        """
+        _LOGGER.info("Setting %s of device %s to %s", key, device_id, value)
+        body = _BOOL_SETTING_BODIES.get((key, value))
+        if body is None:
+            return await self.update_device_settings(
+                home, device_id, {key: {"value": value}}
+            )
+        return await self._patch_device_settings(home, device_id, body)
+
+    async def _toggle_bool_setting(self, home: Home, device_id: str, key: str) -> bool:
+        """
+        Invert a boolean setting of a device.
+        """
+        try:
+            current_settings = await self.get_settings(home, device_id)
+        except ValueError as e:
+            _LOGGER.error(e)
+            return False
+        return await self._set_bool_setting(
+            home, device_id, key, not current_settings.get(key, False)
+        )
+
     async def power_off_device(self, home: Home, device_id: str) -> bool:
         """
         Power off a device.
         """
-        _LOGGER.info("Powering off device %s", device_id)
-        return await self.update_device_settings(
-            home, device_id, {"device_active": {"value": False}}
-        )
+        return await self._set_bool_setting(home, device_id, "device_active", False)
 
     async def power_on_device(self, home: Home, device_id: str) -> bool:
         """
         Power on a device.
         """
-        _LOGGER.info("Powering on device %s", device_id)
-        return await self.update_device_settings(
-            home, device_id, {"device_active": {"value": True}}
-        )
+        return await self._set_bool_setting(home, device_id, "device_active", True)
 
     async def disable_motion_notifications(self, home: Home, device_id: str) -> bool:
         """
         Disable motion notifications for a device.
         """
-        _LOGGER.info("Disabling motion notifications for device %s", device_id)
-        return await self.update_device_settings(
-            home, device_id, {"push_notification_motion": {"value": False}}
+        return await self._set_bool_setting(
+            home, device_id, "push_notification_motion", False
         )
 
     async def enable_motion_notifications(self, home: Home, device_id: str) -> bool:
         """
         Enable motion notifications for a device.
         """
-        _LOGGER.info("Enabling motion notifications for device %s", device_id)
-        return await self.update_device_settings(
-            home, device_id, {"push_notification_motion": {"value": True}}
+        return await self._set_bool_setting(
+            home, device_id, "push_notification_motion", True
         )
 
     async def toggle_motion_notifications(self, home: Home, device_id: str) -> bool:
         """
         Toggle motion notifications for a device.
         """
-        try:
-            current_settings = await self.get_settings(home, device_id)
-        except ValueError as e:
-            _LOGGER.error(e)
-            return False
-        new_value = not current_settings.get("push_notification_motion", False)
-        _LOGGER.info(
-            "Toggling motion notifications for device %s to %s", device_id, new_value
-        )
-        return await self.update_device_settings(
-            home, device_id, {"push_notification_motion": {"value": new_value}}
+        return await self._toggle_bool_setting(
+            home, device_id, "push_notification_motion"
         )
 
     async def toggle_device_power(self, home: Home, device_id: str) -> bool:
         """
         Toggle the power state of a device.
         """
-        try:
-            current_settings = await self.get_settings(home, device_id)
-        except ValueError as e:
-            _LOGGER.error(e)
-            return False
-        new_value = not current_settings.get("device_active", False)
-        _LOGGER.info("Toggling power for device %s to %s", device_id, new_value)
-        return await self.update_device_settings(
-            home, device_id, {"device_active": {"value": new_value}}
+        return await self._toggle_bool_setting(home, device_id, "device_active")
+
+    async def set_devices_power(
+        self, home: Home, states: Dict[str, bool]
+    ) -> Dict[str, Union[bool, BaseException]]:
+        """
+        Power several devices on or off concurrently.
+
+        Args:
+            home (Home): The home the devices belong to.
+            states (Dict[str, bool]): The desired power state per device ID.
+
+        Returns:
+            Dict[str, Union[bool, BaseException]]:
+                Per device ID, the update result or the exception it raised.
+        """
+        return await self._set_devices_bool_setting(home, "device_active", states)
+
+    async def set_devices_motion_notifications(
+        self, home: Home, states: Dict[str, bool]
+    ) -> Dict[str, Union[bool, BaseException]]:
+        """
+        Enable or disable motion notifications for several devices concurrently.
+
+        Args:
+            home (Home): The home the devices belong to.
+            states (Dict[str, bool]): The desired notification state per device ID.
+
+        Returns:
+            Dict[str, Union[bool, BaseException]]:
+                Per device ID, the update result or the exception it raised.
+        """
+        return await self._set_devices_bool_setting(
+            home, "push_notification_motion", states
+        )
+
+    async def _set_devices_bool_setting(
+        self, home: Home, key: str, states: Dict[str, bool]
+    ) -> Dict[str, Union[bool, BaseException]]:
+        """
+        Set a boolean setting on several devices concurrently.
+        """
+        await self.get_authorized_session()
+        results = await asyncio.gather(
+            *(
+                self._set_bool_setting(home, device_id, key, value)
+                for device_id, value in states.items()
+            ),
+            return_exceptions=True,
+        )
+        return dict(zip(states, results))
+
+    async def get_home_snapshot(
+        self, home: Home
+    ) -> Tuple[List[Device], List[Meal], List[ModeDevice]]:
+        """
+        Get the devices, meals and mode devices of a home concurrently.
+
+        Args:
+            home (Home): The home to retrieve the data for.
+
+        Returns:
+            Tuple[List[Device], List[Meal], List[ModeDevice]]:
+                The devices, meals and mode devices of the home.
+        """
+        await self.get_authorized_session()
+        devices, meals, mode_devices = await asyncio.gather(
+            self.get_devices(home),
+            self.meals.get_meals(home),
+            self.get_mode_devices(home),
+        )
+        return devices, meals, mode_devices
+
+    async def get_home_snapshot_with_events(
+        self, home: Home, from_date, to_date, types: str = "none"
+    ) -> Tuple[List[Device], List[Meal], List[ModeDevice], List[Event]]:
+        """
+        Get the devices, meals, mode devices and events of a home concurrently.
+
+        Args:
+            home (Home): The home to retrieve the data for.
+            from_date (datetime): The start date for event retrieval.
+            to_date (datetime): The end date for event retrieval.
+            types (str): Comma-separated event types to filter by.
+
+        Returns:
+            Tuple[List[Device], List[Meal], List[ModeDevice], List[Event]]:
+                The devices, meals, mode devices and events of the home.
+        """
+        await self.get_authorized_session()
+        snapshot, events = await asyncio.gather(
+            self.get_home_snapshot(home),
+            self.events.get_events(home, from_date, to_date, types),
         )
+        return (*snapshot, events)
+
+    async def get_all_homes_devices(self) -> List[List[Device]]:
+        """
+        Get the devices of every available home concurrently.
+
+        Returns:
+            List[List[Device]]: The devices per home, in the order of get_homes.
+        """
+        homes = await self.get_homes()
+        return await asyncio.gather(*(self.get_devices(home) for home in homes))
 
     async def __aenter__(self):
         await self.get_client()
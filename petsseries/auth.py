@@ -5,22 +5,57 @@ This module handles loading, saving, and refreshing authentication tokens,
 as well as decoding JWTs to retrieve necessary information.
 """
 
+import asyncio
 import time
 import json
 import logging
 import os
-from typing import Optional, Dict
+import stat
+import tempfile
+from contextlib import suppress
+from typing import Any, Optional, Dict, Tuple
 
 import aiofiles
+import aiofiles.os
 import aiohttp
 import jwt
+from multidict import CIMultiDict, CIMultiDictProxy
 
-from .session import create_ssl_context
+from .session import ACCEPT_ENCODING, get_ssl_context, json_loads, read_json
 from .config import Config
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# Static headers for the token endpoint; aiohttp derives Host from the URL.
+# Read-only, as every AuthManager in the process shares them.
+TOKEN_HEADERS: CIMultiDictProxy[str] = CIMultiDictProxy(
+    CIMultiDict(
+        {
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Accept": "application/json",
+            "Connection": "keep-alive",
+            "Content-Type": "application/x-www-form-urlencoded",
+            "User-Agent": "UnofficialPetsSeriesClient/1.0",
+        }
+    )
+)
+
+
+def _create_temp_file(path: str) -> Tuple[int, str]:
+    """
+    Create a uniquely named temporary file next to path to write its new contents to.
+
+    The file takes over the permissions of the existing file at path; without one
+    it is only accessible by its owner.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), prefix=".tokens-", suffix=".tmp"
+    )
+    with suppress(OSError):
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+    return fd, tmp_path
+
 
 class AuthError(Exception):
     """Custom exception for authentication errors."""
@@ -29,7 +64,7 @@ class AuthError(Exception):
         super().__init__(message)
 
 
-class AuthManager:
+class AuthManager:  # pylint: disable=too-many-instance-attributes
     """
     Manages authentication tokens for the PetsSeries client.
 
@@ -41,6 +76,7 @@ class AuthManager:
         token_file: str = "tokens.json",
         access_token: Optional[str] = None,
         refresh_token: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         """
         Initialize the AuthManager.
@@ -49,6 +85,8 @@ class AuthManager:
             token_file (str): Path to the token file.
             access_token (Optional[str]): Existing access token.
             refresh_token (Optional[str]): Existing refresh token.
+            session (Optional[aiohttp.ClientSession]): A session to share instead
+                of creating one; it is left open by close().
         """
         self.token_file_path = os.path.join(os.path.dirname(__file__), token_file)
         _LOGGER.info(
@@ -58,8 +96,27 @@ class AuthManager:
         self.access_token = access_token
         self.refresh_token = refresh_token
         self.id_token: Optional[str] = None
-        self.session: Optional[aiohttp.ClientSession] = None
+        # Claims of the access token they were decoded from
+        self._claims_token: Optional[str] = None
+        self._decoded_claims: Dict[str, Any] = {}
+        # Tokens as last read from or written to the token file
+        self._saved_tokens: Tuple[Optional[str], Optional[str]] = (None, None)
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self.timeout = aiohttp.ClientTimeout(total=10.0)
+        self._refresh_lock = asyncio.Lock()
+
+    async def set_session(self, session: aiohttp.ClientSession) -> None:
+        """
+        Use a shared session for token requests, closing the one created here if any.
+
+        Args:
+            session (aiohttp.ClientSession): The session to share; its owner closes it.
+        """
+        if self.session is not session:
+            await self.close()
+        self.session = session
+        self._owns_session = False
 
     async def _get_session(self) -> aiohttp.ClientSession:
         # pylint: disable=duplicate-code
@@ -70,11 +127,12 @@ class AuthManager:
             aiohttp.ClientSession: The HTTP session.
         """
         if self.session is None:
-            ssl_context = await create_ssl_context()
+            ssl_context = await get_ssl_context()
             connector = aiohttp.TCPConnector(ssl=ssl_context)
             self.session = aiohttp.ClientSession(
                 timeout=self.timeout, connector=connector
             )
+            self._owns_session = True
             _LOGGER.debug("aiohttp.ClientSession initialized with certifi CA bundle.")
         return self.session
 
@@ -88,9 +146,10 @@ class AuthManager:
         try:
             async with aiofiles.open(self.token_file_path, "r") as file:
                 token_content = await file.read()
-            token_content = json.loads(token_content)
+            token_content = json_loads(token_content)
             self.access_token = token_content.get("access_token")
             self.refresh_token = token_content.get("refresh_token")
+            self._saved_tokens = (self.access_token, self.refresh_token)
             _LOGGER.info("Tokens loaded successfully.")
         except FileNotFoundError as exc:
             _LOGGER.warning("Token file not found at: %s", self.token_file_path)
@@ -106,6 +165,23 @@ class AuthManager:
             _LOGGER.error("Unexpected error loading tokens: %s", exc)
             raise AuthError(f"Unexpected error loading tokens: {exc}") from exc
 
+    def _claims(self) -> Dict[str, Any]:
+        """
+        Decode the access token, reusing the claims until the token changes.
+
+        Raises:
+            jwt.DecodeError: If the access token is not a valid JWT.
+        """
+        if self._claims_token is not self.access_token:
+            # Decode without verifying the signature
+            self._decoded_claims = jwt.decode(
+                self.access_token,
+                options={"verify_signature": False},
+                algorithms=["RS256"],
+            )
+            self._claims_token = self.access_token
+        return self._decoded_claims
+
     async def get_client_id(self) -> str:
         """
         Decode the access token to retrieve the client ID.
@@ -120,13 +196,7 @@ class AuthManager:
             _LOGGER.error("Access token is None")
             raise AuthError("Access token is None")
         try:
-            # Decode without verifying the signature
-            token = jwt.decode(
-                self.access_token,
-                options={"verify_signature": False},
-                algorithms=["RS256"],
-            )
-            client_id = token.get("client_id")
+            client_id = self._claims().get("client_id")
             if not client_id:
                 _LOGGER.error("client_id not found in token")
                 raise AuthError("client_id not found in token")
@@ -152,12 +222,7 @@ class AuthManager:
             _LOGGER.error("Access token is None")
             raise AuthError("Access token is None")
         try:
-            token = jwt.decode(
-                self.access_token,
-                options={"verify_signature": False},
-                algorithms=["RS256"],
-            )
-            exp = token.get("exp")
+            exp = self._claims().get("exp")
             if exp is None:
                 _LOGGER.error("Expiration time (exp) not found in token")
                 raise AuthError("Expiration time (exp) not found in token")
@@ -185,12 +250,29 @@ class AuthManager:
         """
         Refresh the access token using the refresh token.
 
+        Concurrent callers share a single refresh, so the refresh token is
+        never used twice in parallel.
+
         Returns:
             Dict[str, str]: The refreshed tokens.
 
         Raises:
             AuthError: If the token refresh fails.
         """
+        stale_token = self.access_token
+        async with self._refresh_lock:
+            if self.access_token is not stale_token:
+                # Another caller refreshed the token while we waited for the lock
+                return {
+                    "access_token": self.access_token,
+                    "refresh_token": self.refresh_token,
+                }
+            return await self._request_new_tokens()
+
+    async def _request_new_tokens(self) -> Dict[str, str]:
+        """
+        Exchange the refresh token for a new access token at the token endpoint.
+        """
         _LOGGER.info("Access token expired, refreshing...")
         client_id = await self.get_client_id()
         data = {
@@ -198,25 +280,20 @@ class AuthManager:
             "refresh_token": self.refresh_token,
             "client_id": client_id,
         }
-        headers = {
-            "Accept-Encoding": "gzip",
-            "Accept": "application/json",
-            "Connection": "keep-alive",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "User-Agent": "UnofficialPetsSeriesClient/1.0",
-        }
 
         try:
             _LOGGER.debug(
-                "Refreshing access token with data: %s and headers: %s", data, headers
+                "Refreshing access token with data: %s and headers: %s",
+                data,
+                TOKEN_HEADERS,
             )
             session = await self._get_session()
             async with session.post(
-                Config.token_url, headers=headers, data=data
+                Config.token_url, headers=TOKEN_HEADERS, data=data
             ) as response:
                 _LOGGER.debug("Token refresh response status: %s", response.status)
                 if response.status == 200:
-                    response_json = await response.json()
+                    response_json = await read_json(response)
                     self.access_token = response_json.get("access_token")
                     self.refresh_token = response_json.get("refresh_token")
                     _LOGGER.info("Access token refreshed successfully.")
@@ -279,23 +356,46 @@ class AuthManager:
                 self.refresh_token = refresh_token
             if id_token:
                 self.id_token = id_token
+            if (self.access_token, self.refresh_token) == self._saved_tokens:
+                _LOGGER.debug(
+                    "Tokens unchanged, not rewriting %s", self.token_file_path
+                )
+                return
             tokens = {
                 "access_token": self.access_token,
                 "refresh_token": self.refresh_token,
             }
-            async with aiofiles.open(self.token_file_path, "w") as file:
-                await file.write(json.dumps(tokens, indent=4))
+            # Write to a unique temporary file next to tokens.json, sync it to
+            # disk and swap it in, so a crash mid-write never leaves a
+            # truncated refresh token behind
+            fd, tmp_path = await asyncio.to_thread(
+                _create_temp_file, self.token_file_path
+            )
+            try:
+                async with aiofiles.open(fd, "w") as file:
+                    fd = None  # Closed along with the file from here on
+                    await file.write(json.dumps(tokens, indent=4))
+                    await file.flush()
+                    await asyncio.to_thread(os.fsync, file.fileno())
+                await aiofiles.os.replace(tmp_path, self.token_file_path)
+            except BaseException:
+                if fd is not None:
+                    os.close(fd)
+                with suppress(OSError):
+                    await aiofiles.os.remove(tmp_path)
+                raise
+            self._saved_tokens = (self.access_token, self.refresh_token)
             _LOGGER.info("Tokens saved successfully to %s", self.token_file_path)
         except Exception as e:
             _LOGGER.error("Failed to save tokens.json: %s", e)
             raise AuthError(f"Failed to save tokens.json: {e}") from e
 
     async def close(self) -> None:
-        """Close the aiohttp session."""
-        if self.session:
+        """Close the aiohttp session, unless it is shared with the caller."""
+        if self.session and self._owns_session:
             await self.session.close()
-            self.session = None
             _LOGGER.debug("aiohttp.ClientSession closed.")
+        self.session = None
 
     async def __aenter__(self) -> "AuthManager":
         """Enter the runtime context related to this object."""
@@ -0,0 +1,91 @@
+"""
+Circuit breaker for the PetsSeries backend.
+
+Lets the PetsSeriesClient fail fast during a backend outage instead of waiting
+for every request to time out.
+"""
+
+import logging
+import time
+from typing import Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ServiceUnavailableError(Exception):
+    """Raised when a request is rejected because the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive backend failures and rejects calls while the backend is down.
+
+    The breaker starts closed and lets every call through. After fail_threshold
+    consecutive failures it opens and rejects calls for reset_after seconds. It
+    then lets a single probe through (half-open): a success closes it again,
+    a failure re-opens it.
+    """
+
+    def __init__(self, fail_threshold: int = 5, reset_after: float = 30.0):
+        self.fail_threshold = fail_threshold
+        self.reset_after = reset_after
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """
+        The current state: "closed", "open" or "half_open".
+        """
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.reset_after:
+            return "open"
+        return "half_open"
+
+    def before(self) -> None:
+        """
+        Check whether a call may go through.
+
+        Raises:
+            ServiceUnavailableError: If the breaker is open, or half-open with
+                a probe already in flight.
+        """
+        if self._opened_at is None:
+            return
+        if self._probing or time.monotonic() - self._opened_at < self.reset_after:
+            raise ServiceUnavailableError(
+                "PetsSeries backend unavailable; circuit breaker is open."
+            )
+        self._probing = True
+
+    def record_success(self) -> None:
+        """
+        Record a call that reached a healthy backend.
+        """
+        if self._opened_at is not None:
+            _LOGGER.info("Backend recovered, closing circuit breaker.")
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """
+        Record a call that failed because of the backend or the connection to it.
+        """
+        self._failures += 1
+        if self._probing or self._failures >= self.fail_threshold:
+            if self._opened_at is None:
+                _LOGGER.warning(
+                    "Opening circuit breaker after %d consecutive failures.",
+                    self._failures,
+                )
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def release(self) -> None:
+        """
+        Forget an admitted call whose outcome is unknown, e.g. because it was cancelled.
+        """
+        self._probing = False
@@ -3,10 +3,11 @@ This module contains the configuration for the PetsSeries system.
 """
 
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
-class Config:
+class Config:  # pylint: disable=too-many-instance-attributes
     """
     Represents the configuration for the PetsSeries system.
     """
@@ -18,7 +19,26 @@ class Config:
     consumer_url: str = (
         "https://nbx-discovery.prod.eu-hs.iot.versuni.com/api/petsseries/consumer"
     )
-    homes_url: str = base_url + "/api/v1/home-management/available-homes"
+    # Derived from base_url unless set explicitly
+    homes_url: Optional[str] = None
+    homes_api_url: Optional[str] = None
     token_url: str = (
         "https://cdc.accounts.home.id/oidc/op/v1.0/4_JGZWlP8eQHpEqkvQElolbA/token"
     )
+    # Connection pool of the shared session; idle connections are kept warm
+    # between polls for keepalive_timeout seconds
+    connector_limit: int = 100
+    connector_limit_per_host: int = 20
+    keepalive_timeout: float = 75.0
+    dns_cache_ttl: int = 300
+    # Maximum number of API requests the client keeps in flight at once
+    max_concurrent_requests: int = 8
+    # Consecutive backend failures before requests fail fast, and for how long
+    breaker_fail_threshold: int = 5
+    breaker_reset_after: float = 30.0
+
+    def __post_init__(self):
+        if self.homes_url is None:
+            self.homes_url = self.base_url + "/api/v1/home-management/available-homes"
+        if self.homes_api_url is None:
+            self.homes_api_url = self.base_url + "/api/homes"
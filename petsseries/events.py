@@ -5,10 +5,15 @@ EventsManager module for handling event-related operations in the PetsSeriesClie
 """
 
 import logging
-from typing import List
-import urllib.parse
+from typing import AsyncIterator, List
 
-import aiohttp
+from yarl import URL
+
+# Optional import for ijson
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from .models import (
     Home,
@@ -23,10 +28,64 @@ from .models import (
     DeviceOfflineEvent,
     DeviceOnlineEvent,
 )
-from .config import Config
+from .session import home_url, log_request_errors, read_json
 
 _LOGGER = logging.getLogger(__name__)
 
+# Event type names mapped to the values expected by the backend
+_EVENT_TYPE_VALUES = {
+    event_type.name: str(event_type.value) for event_type in Event.get_event_types()
+}
+
+# Mapping of dataclass field names to the JSON keys returned by the backend
+_COMMON_FIELDS = (
+    ("id", "id"),
+    ("source", "source"),
+    ("time", "time"),
+    ("url", "url"),
+    ("cluster_id", "clusterId"),
+    ("metadata", "metadata"),
+)
+_DEVICE_FIELDS = (
+    ("device_id", "deviceId"),
+    ("device_name", "deviceName"),
+    ("product_ctn", "productCtn"),
+    ("device_external_id", "deviceExternalId"),
+)
+_MEAL_FIELDS = (
+    ("meal_name", "mealName"),
+    ("meal_url", "mealUrl"),
+    ("meal_amount", "mealAmount"),
+)
+
+_DEVICE_EVENT_FIELDS = _COMMON_FIELDS + _DEVICE_FIELDS
+
+# Event type mapped to its dataclass and the fields to read from the payload
+_EVENT_DISPATCH = {
+    "motion_detected": (
+        MotionEvent,
+        _DEVICE_EVENT_FIELDS
+        + (("thumbnail_key", "thumbnailKey"), ("thumbnail_url", "thumbnailUrl")),
+    ),
+    "meal_dispensed": (MealDispensedEvent, _DEVICE_EVENT_FIELDS + _MEAL_FIELDS),
+    "meal_upcoming": (MealUpcomingEvent, _DEVICE_EVENT_FIELDS + _MEAL_FIELDS),
+    "food_level_low": (FoodLevelLowEvent, _DEVICE_EVENT_FIELDS),
+    "meal_enabled": (
+        MealEnabledEvent,
+        _DEVICE_EVENT_FIELDS
+        + (
+            ("meal_amount", "mealAmount"),
+            ("meal_url", "mealUrl"),
+            ("meal_time", "mealTime"),
+            ("meal_repeat_days", "mealRepeatDays"),
+        ),
+    ),
+    "filter_replacement_due": (FilterReplacementDueEvent, _DEVICE_EVENT_FIELDS),
+    "food_outlet_stuck": (FoodOutletStuckEvent, _DEVICE_EVENT_FIELDS),
+    "device_offline": (DeviceOfflineEvent, _DEVICE_EVENT_FIELDS),
+    "device_online": (DeviceOnlineEvent, _DEVICE_EVENT_FIELDS),
+}
+
 
 class EventsManager:
     """
@@ -41,7 +100,7 @@ class EventsManager:
             client (PetsSeriesClient): The main API client.
         """
         self.client = client
-        self.config = Config()
+        self.config = client.config
 
     async def get_events(
         self, home: Home, from_date, to_date, types: str = "none"
@@ -63,52 +122,79 @@ class EventsManager:
             aiohttp.ClientResponseError: If the HTTP request fails.
             Exception: For any unexpected errors.
         """
-        clustered = "true"
-        await self.client.ensure_token_valid()
+        return [
+            event async for event in self.iter_events(home, from_date, to_date, types)
+        ]
+
+    async def iter_events(
+        self, home: Home, from_date, to_date, types: str = "none"
+    ) -> AsyncIterator[Event]:
+        """
+        Iterate over events for the selected home within a date range.
+
+        When ijson is installed the response is parsed incrementally, so events
+        are yielded as they arrive instead of after the whole body is loaded.
+
+        Args:
+            home (Home): The home to retrieve events for.
+            from_date (datetime): The start date for event retrieval.
+            to_date (datetime): The end date for event retrieval.
+            types (str): Comma-separated event types to filter by.
+
+        Yields:
+            Event: The parsed Event objects.
+
+        Raises:
+            ValueError: If an invalid event type is provided.
+            aiohttp.ClientResponseError: If the HTTP request fails.
+            Exception: For any unexpected errors.
+        """
+        url = self._events_url(home, from_date, to_date, types)
+        _LOGGER.debug("Getting events from %s", url)
+        with log_request_errors(_LOGGER, "get events"):
+            async with self.client.request("GET", url) as response:
+                response.raise_for_status()
+                if ijson is None:
+                    events_data = await read_json(response)
+                    for event in events_data.get("item", []):
+                        yield self.parse_event(event)
+                else:
+                    async for event in ijson.items_async(
+                        response.content, "item.item", use_float=True
+                    ):
+                        yield self.parse_event(event)
+
+    def _events_url(self, home: Home, from_date, to_date, types: str) -> URL:
+        """
+        Build the events URL for a home, validating the requested event types.
+
+        Raises:
+            ValueError: If an invalid event type is provided.
+        """
+        query = {
+            "from": from_date.isoformat(),
+            "to": to_date.isoformat(),
+            "clustered": "true",
+        }
         if types != "none":
-            valid_event_types = Event.get_event_types()
-            requested_types = set(str(types).split(","))
-            requested_types = {et.replace("EventType.", "") for et in requested_types}
-            invalid_types = requested_types - {et.name for et in valid_event_types}
+            requested_types = {
+                et.replace("EventType.", "") for et in str(types).split(",")
+            }
+            invalid_types = requested_types - _EVENT_TYPE_VALUES.keys()
             if invalid_types:
                 _LOGGER.error("Invalid event types: %s", invalid_types)
                 raise ValueError(f"Invalid event types: {invalid_types}")
 
             # Map event type names to their corresponding values
             types_mapped = [
-                str(event_type.value)
-                for event_type in valid_event_types
-                if event_type.name in requested_types
+                value
+                for name, value in _EVENT_TYPE_VALUES.items()
+                if name in requested_types
             ]
-            types_param = f"&types={','.join(types_mapped)}" if types_mapped else ""
-        else:
-            types_param = ""
-
-        from_date_encoded = urllib.parse.quote(from_date.isoformat())
-        to_date_encoded = urllib.parse.quote(to_date.isoformat())
-
-        url = (
-            f"https://petsseries-backend.prod.eu-hs.iot.versuni.com/"
-            f"api/homes/{home.id}/events"
-            f"?from={from_date_encoded}&to={to_date_encoded}&clustered={clustered}"
-            f"{types_param}"
-        )
-        _LOGGER.debug("Getting events from %s", url)
-        session = await self.client.get_client()
-        try:
-            async with session.get(url, headers=self.client.headers) as response:
-                response.raise_for_status()
-                events_data = await response.json()
-                events = [
-                    self.parse_event(event) for event in events_data.get("item", [])
-                ]
-                return events
-        except aiohttp.ClientResponseError as e:
-            _LOGGER.error("Failed to get events: %s %s", e.status, e.message)
-            raise
-        except Exception as e:
-            _LOGGER.error("Unexpected error in get_events: %s", e)
-            raise
+            if types_mapped:
+                query["types"] = ",".join(types_mapped)
+
+        return home_url(self.client.homes_api, home.id, "events").with_query(query)
 
     async def get_event(self, home: Home, event_id: str) -> Event:
         """
@@ -125,25 +211,10 @@ class EventsManager:
             aiohttp.ClientResponseError: If the HTTP request fails.
             Exception: For any unexpected errors.
         """
-        await self.client.ensure_token_valid()
-        url = (
-            f"https://petsseries-backend.prod.eu-hs.iot.versuni.com/"
-            f"api/homes/{home.id}/events/{event_id}"
+        event_data = await self.client.get_json(
+            home_url(self.client.homes_api, home.id, "events", event_id)
         )
-        session = await self.client.get_client()
-        try:
-            async with session.get(url, headers=self.client.headers) as response:
-                response.raise_for_status()
-                event_data = await response.json()
-                return self.parse_event(event_data)
-        except aiohttp.ClientResponseError as e:
-            _LOGGER.error(
-                "Failed to get event %s: %s %s", event_id, e.status, e.message
-            )
-            raise
-        except Exception as e:
-            _LOGGER.error("Unexpected error in get_event: %s", e)
-            raise
+        return self.parse_event(event_data)
 
     def parse_event(self, event: dict) -> Event:
         """
@@ -156,152 +227,19 @@ class EventsManager:
             Event: The parsed Event object.
         """
         event_type = event.get("type")
-        match event_type:
-            case "motion_detected":
-                return MotionEvent(
-                    id=event.get("id"),
-                    type=event_type,
-                    source=event.get("source"),
-                    time=event.get("time"),
-                    url=event.get("url"),
-                    cluster_id=event.get("clusterId"),
-                    metadata=event.get("metadata"),
-                    thumbnail_key=event.get("thumbnailKey"),
-                    device_id=event.get("deviceId"),
-                    device_name=event.get("deviceName"),
-                    thumbnail_url=event.get("thumbnailUrl"),
-                    product_ctn=event.get("productCtn"),
-                    device_external_id=event.get("deviceExternalId"),
-                )
-            case "meal_dispensed":
-                return MealDispensedEvent(
-                    id=event.get("id"),
-                    type=event_type,
-                    source=event.get("source"),
-                    time=event.get("time"),
-                    url=event.get("url"),
-                    cluster_id=event.get("clusterId"),
-                    metadata=event.get("metadata"),
-                    meal_name=event.get("mealName"),
-                    device_id=event.get("deviceId"),
-                    meal_url=event.get("mealUrl"),
-                    meal_amount=event.get("mealAmount"),
-                    device_name=event.get("deviceName"),
-                    device_external_id=event.get("deviceExternalId"),
-                    product_ctn=event.get("productCtn"),
-                )
-            case "meal_upcoming":
-                return MealUpcomingEvent(
-                    id=event.get("id"),
-                    type=event_type,
-                    source=event.get("source"),
-                    time=event.get("time"),
-                    url=event.get("url"),
-                    cluster_id=event.get("clusterId"),
-                    metadata=event.get("metadata"),
-                    meal_name=event.get("mealName"),
-                    device_id=event.get("deviceId"),
-                    meal_url=event.get("mealUrl"),
-                    meal_amount=event.get("mealAmount"),
-                    device_name=event.get("deviceName"),
-                    device_external_id=event.get("deviceExternalId"),
-                    product_ctn=event.get("productCtn"),
-                )
-            case "food_level_low":
-                return FoodLevelLowEvent(
-                    id=event.get("id"),
-                    type=event_type,
-                    source=event.get("source"),
-                    time=event.get("time"),
-                    url=event.get("url"),
-                    cluster_id=event.get("clusterId"),
-                    metadata=event.get("metadata"),
-                    device_id=event.get("deviceId"),
-                    device_name=event.get("deviceName"),
-                    product_ctn=event.get("productCtn"),
-                    device_external_id=event.get("deviceExternalId"),
-                )
-            case "meal_enabled":
-                return MealEnabledEvent(
-                    id=event.get("id"),
-                    type=event_type,
-                    source=event.get("source"),
-                    time=event.get("time"),
-                    url=event.get("url"),
-                    cluster_id=event.get("clusterId"),
-                    metadata=event.get("metadata"),
-                    meal_amount=event.get("mealAmount"),
-                    meal_url=event.get("mealUrl"),
-                    device_external_id=event.get("deviceExternalId"),
-                    product_ctn=event.get("productCtn"),
-                    meal_time=event.get("mealTime"),
-                    device_id=event.get("deviceId"),
-                    device_name=event.get("deviceName"),
-                    meal_repeat_days=event.get("mealRepeatDays"),
-                )
-            case "filter_replacement_due":
-                return FilterReplacementDueEvent(
-                    id=event.get("id"),
-                    type=event_type,
-                    source=event.get("source"),
-                    time=event.get("time"),
-                    url=event.get("url"),
-                    cluster_id=event.get("clusterId"),
-                    metadata=event.get("metadata"),
-                    device_id=event.get("deviceId"),
-                    device_name=event.get("deviceName"),
-                    product_ctn=event.get("productCtn"),
-                    device_external_id=event.get("deviceExternalId"),
-                )
-            case "food_outlet_stuck":
-                return FoodOutletStuckEvent(
-                    id=event.get("id"),
-                    type=event_type,
-                    source=event.get("source"),
-                    time=event.get("time"),
-                    url=event.get("url"),
-                    cluster_id=event.get("clusterId"),
-                    metadata=event.get("metadata"),
-                    device_id=event.get("deviceId"),
-                    device_name=event.get("deviceName"),
-                    product_ctn=event.get("productCtn"),
-                    device_external_id=event.get("deviceExternalId"),
-                )
-            case "device_offline":
-                return DeviceOfflineEvent(
-                    id=event.get("id"),
-                    type=event_type,
-                    source=event.get("source"),
-                    time=event.get("time"),
-                    url=event.get("url"),
-                    cluster_id=event.get("clusterId"),
-                    metadata=event.get("metadata"),
-                    device_id=event.get("deviceId"),
-                    device_name=event.get("deviceName"),
-                    product_ctn=event.get("productCtn"),
-                    device_external_id=event.get("deviceExternalId"),
-                )
-            case "device_online":
-                return DeviceOnlineEvent(
-                    id=event.get("id"),
-                    type=event_type,
-                    source=event.get("source"),
-                    time=event.get("time"),
-                    url=event.get("url"),
-                    cluster_id=event.get("clusterId"),
-                    metadata=event.get("metadata"),
-                    device_id=event.get("deviceId"),
-                    device_name=event.get("deviceName"),
-                    product_ctn=event.get("productCtn"),
-                    device_external_id=event.get("deviceExternalId"),
-                )
-            case _:
-                _LOGGER.warning("Unknown event type: %s", event_type)
-                # Generic event
-                return Event(
-                    id=event["id"],
-                    type=event_type,
-                    source=event["source"],
-                    time=event["time"],
-                    url=event["url"],
-                )
+        dispatch = _EVENT_DISPATCH.get(event_type)
+        if dispatch is None:
+            _LOGGER.warning("Unknown event type: %s", event_type)
+            # Generic event
+            return Event(
+                id=event["id"],
+                type=event_type,
+                source=event["source"],
+                time=event["time"],
+                url=event["url"],
+            )
+        event_class, fields = dispatch
+        get = event.get
+        return event_class(
+            type=event_type, **{field: get(key) for field, key in fields}
+        )
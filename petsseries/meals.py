@@ -5,16 +5,39 @@ MealsManager module for handling meal-related operations in the PetsSeriesClient
 """
 
 import logging
+from operator import itemgetter
 from typing import List
-import urllib.parse
 
 import aiohttp
 
 from .models import Meal, Home
-from .config import Config
+from .session import (
+    handle_unexpected_response,
+    home_url,
+    log_request_errors,
+    read_json,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# JSON keys in the positional order of the Meal dataclass fields
+_MEAL_KEYS = itemgetter(
+    "id",
+    "name",
+    "portionAmount",
+    "feedTime",
+    "repeatDays",
+    "deviceId",
+    "enabled",
+    "url",
+)
+
+# Meals repeat every day of the week unless specified otherwise
+_DEFAULT_REPEAT_DAYS = (1, 2, 3, 4, 5, 6, 7)
+
+# Request bodies for set_meal_enabled, indexed by the desired state
+_ENABLED_PAYLOADS = ({"enabled": False}, {"enabled": True})
+
 
 class MealsManager:
     """
@@ -29,39 +52,16 @@ class MealsManager:
             client (PetsSeriesClient): The main API client.
         """
         self.client = client
-        self.config = Config()
+        self.config = client.config
 
     async def get_meals(self, home: Home) -> List[Meal]:
         """
         Get meals for the selected home.
         """
-        await self.client.ensure_token_valid()
-        url = f"{self.config.base_url}/api/homes/{home.id}/meals"
-        session = await self.client.get_client()
-        try:
-            async with session.get(url, headers=self.client.headers) as response:
-                response.raise_for_status()
-                meals_data = await response.json()
-                meals = [
-                    Meal(
-                        id=meal["id"],
-                        name=meal["name"],
-                        portion_amount=meal["portionAmount"],
-                        feed_time=meal["feedTime"],
-                        repeat_days=meal["repeatDays"],
-                        device_id=meal["deviceId"],
-                        enabled=meal["enabled"],
-                        url=meal["url"],
-                    )
-                    for meal in meals_data.get("item", [])
-                ]
-                return meals
-        except aiohttp.ClientResponseError as e:
-            _LOGGER.error("Failed to get meals: %s %s", e.status, e.message)
-            raise
-        except Exception as e:
-            _LOGGER.error("Unexpected error in get_meals: %s", e)
-            raise
+        meals_data = await self.client.get_json(
+            home_url(self.client.homes_api, home.id, "meals")
+        )
+        return [Meal(*_MEAL_KEYS(meal)) for meal in meals_data.get("item", [])]
 
     async def update_meal(self, home: Home, meal: Meal) -> Meal:
         """
@@ -79,28 +79,23 @@ class MealsManager:
             aiohttp.ClientResponseError: If the HTTP request fails.
             Exception: For any unexpected errors.
         """
-        await self.client.ensure_token_valid()
-
         if not meal.id:
             raise ValueError("Meal ID must be provided for updating a meal.")
 
-        url = f"{self.config.base_url}/api/homes/{home.id}/meals/{meal.id}"
+        url = home_url(self.client.homes_api, home.id, "meals", meal.id)
 
         # Prepare the payload with updated fields
         payload = {
             "name": meal.name,
             "portionAmount": meal.portion_amount,
             "feedTime": meal.feed_time.isoformat(),
-            "repeatDays": meal.repeat_days or [1, 2, 3, 4, 5, 6, 7],
+            "repeatDays": meal.repeat_days or _DEFAULT_REPEAT_DAYS,
         }
 
-        session = await self.client.get_client()
-        try:
-            async with session.patch(
-                url, headers=self.client.headers, json=payload
-            ) as response:
+        with log_request_errors(_LOGGER, "update meal %s", meal.id):
+            async with self.client.request("PATCH", url, json=payload) as response:
                 if response.status == 200:
-                    updated_data = await response.json()
+                    updated_data = await read_json(response)
                     _LOGGER.info("Meal %s updated successfully.", meal.id)
                     return Meal(
                         id=updated_data["id"],
@@ -108,25 +103,13 @@ class MealsManager:
                         portion_amount=updated_data["portionAmount"],
                         feed_time=updated_data["feedTime"],
                         repeat_days=updated_data.get(
-                            "repeatDays", [1, 2, 3, 4, 5, 6, 7]
+                            "repeatDays", list(_DEFAULT_REPEAT_DAYS)
                         ),
                         device_id=updated_data["deviceId"],
                         enabled=updated_data.get("enabled", True),
                         url=updated_data["url"],
                     )
-                text = await response.text()
-                _LOGGER.error(
-                    "Failed to update meal %s: %s %s", meal.id, response.status, text
-                )
-                response.raise_for_status()
-        except aiohttp.ClientResponseError as e:
-            _LOGGER.error(
-                "Failed to update meal %s: %s %s", meal.id, e.status, e.message
-            )
-            raise
-        except Exception as e:
-            _LOGGER.error("Unexpected error in update_meal: %s", e)
-            raise
+                await handle_unexpected_response(_LOGGER, response)
 
     async def create_meal(self, home: Home, meal: Meal) -> Meal:
         """
@@ -143,26 +126,23 @@ class MealsManager:
             aiohttp.ClientResponseError: If the HTTP request fails.
             Exception: For any unexpected errors.
         """
-        await self.client.ensure_token_valid()
         if meal.repeat_days is None:
-            repeat_days = [1, 2, 3, 4, 5, 6, 7]
+            repeat_days = list(_DEFAULT_REPEAT_DAYS)
         else:
             repeat_days = meal.repeat_days
+        feed_time = meal.feed_time.isoformat()
 
         payload = {
             "deviceId": meal.device_id,
-            "feedTime": meal.feed_time.isoformat(),
+            "feedTime": feed_time,
             "name": meal.name,
             "portionAmount": meal.portion_amount,
             "repeatDays": repeat_days,
         }
 
-        session = await self.client.get_client()
-        try:
-            async with session.post(
-                f"{self.config.base_url}/api/homes/{home.id}/meals",
-                headers=self.client.headers,
-                json=payload,
+        with log_request_errors(_LOGGER, "create meal"):
+            async with self.client.request(
+                "POST", home_url(self.client.homes_api, home.id, "meals"), json=payload
             ) as response:
 
                 if response.status == 201:
@@ -177,8 +157,7 @@ class MealsManager:
                         )
 
                     # Extract the meal ID from the Location URL
-                    parsed_url = urllib.parse.urlparse(location)
-                    meal_id = parsed_url.path.split("/")[-1]
+                    meal_id = location.partition("?")[0].rstrip("/").rpartition("/")[2]
 
                     _LOGGER.info("Meal created successfully with ID: %s", meal_id)
 
@@ -186,21 +165,13 @@ class MealsManager:
                         id=meal_id,
                         name=meal.name,
                         portion_amount=meal.portion_amount,
-                        feed_time=meal.feed_time.isoformat(),
+                        feed_time=feed_time,
                         repeat_days=repeat_days,
                         device_id=meal.device_id,
                         enabled=True,
                         url=location,
                     )
-                text = await response.text()
-                _LOGGER.error("Failed to create meal: %s %s", response.status, text)
-                response.raise_for_status()
-        except aiohttp.ClientResponseError as e:
-            _LOGGER.error("Failed to create meal: %s %s", e.status, e.message)
-            raise
-        except Exception as e:
-            _LOGGER.error("Unexpected error in create_meal: %s", e)
-            raise
+                await handle_unexpected_response(_LOGGER, response)
 
     async def set_meal_enabled(self, home: Home, meal_id: str, enabled: bool) -> bool:
         """
@@ -218,16 +189,14 @@ class MealsManager:
             aiohttp.ClientResponseError: If the HTTP request fails.
             Exception: For any unexpected errors.
         """
-        await self.client.ensure_token_valid()
-        url = f"{self.config.base_url}/api/homes/{home.id}/meals/{meal_id}"
+        url = home_url(self.client.homes_api, home.id, "meals", meal_id)
 
-        payload = {"enabled": enabled}
+        payload = _ENABLED_PAYLOADS[bool(enabled)]
 
-        session = await self.client.get_client()
-        try:
-            async with session.patch(
-                url, headers=self.client.headers, json=payload
-            ) as response:
+        with log_request_errors(
+            _LOGGER, "%s meal %s", "enable" if enabled else "disable", meal_id
+        ):
+            async with self.client.request("PATCH", url, json=payload) as response:
                 if response.status == 204:
                     _LOGGER.info(
                         "Meal %s has been %s successfully.",
@@ -235,27 +204,7 @@ class MealsManager:
                         "enabled" if enabled else "disabled",
                     )
                     return True
-                text = await response.text()
-                _LOGGER.error(
-                    "Failed to %s meal %s: %s %s",
-                    "enable" if enabled else "disable",
-                    meal_id,
-                    response.status,
-                    text,
-                )
-                response.raise_for_status()
-        except aiohttp.ClientResponseError as e:
-            _LOGGER.error(
-                "Failed to %s meal %s: %s %s",
-                "enable" if enabled else "disable",
-                meal_id,
-                e.status,
-                e.message,
-            )
-            raise
-        except Exception as e:
-            _LOGGER.error("Unexpected error in set_meal_enabled: %s", e)
-            raise
+                await handle_unexpected_response(_LOGGER, response)
 
     async def enable_meal(self, home: Home, meal_id: str) -> bool:
         """
@@ -273,35 +222,15 @@ class MealsManager:
         """
         Delete a specific meal from the selected home.
         """
-        await self.client.ensure_token_valid()
-        url = f"{self.config.base_url}/api/homes/{home.id}/meals/{meal_id}"
+        url = home_url(self.client.homes_api, home.id, "meals", meal_id)
 
-        session = await self.client.get_client()
-        try:
-            async with session.delete(url, headers=self.client.headers) as response:
+        with log_request_errors(
+            _LOGGER, "delete meal %s from home %s", meal_id, home.id
+        ):
+            async with self.client.request("DELETE", url) as response:
                 if response.status == 204:
                     _LOGGER.info(
                         "Meal %s deleted successfully from home %s.", meal_id, home.id
                     )
                     return True
-                text = await response.text()
-                _LOGGER.error(
-                    "Failed to delete meal %s from home %s: %s %s",
-                    meal_id,
-                    home.id,
-                    response.status,
-                    text,
-                )
-                response.raise_for_status()
-        except aiohttp.ClientResponseError as e:
-            _LOGGER.error(
-                "HTTP error while trying to delete meal %s from home %s: %s %s",
-                meal_id,
-                home.id,
-                e.status,
-                e.message,
-            )
-            raise
-        except Exception as e:
-            _LOGGER.error("Unexpected error in delete_meal: %s", e)
-            raise
+                await handle_unexpected_response(_LOGGER, response)
@@ -10,7 +10,7 @@ from enum import Enum
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     Represents a user in the PetsSeries system.
@@ -32,7 +32,7 @@ class User:
     email: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Home:
     """
     Represents a home associated with a user.
@@ -62,7 +62,7 @@ class Home:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class Meal:
     # pylint: disable=too-many-instance-attributes
     """
@@ -89,7 +89,7 @@ class Meal:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Device:
     # pylint: disable=too-many-instance-attributes
     """
@@ -124,7 +124,7 @@ class Device:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class Consumer:
     """
     Represents a consumer in the PetsSeries system.
@@ -140,7 +140,7 @@ class Consumer:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ModeDevice:
     """
     Represents a mode device in the PetsSeries system.
@@ -170,7 +170,7 @@ class EventType(Enum):
     DEVICE_OFFLINE = "device_offline"
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """
     Base class for events in the PetsSeries system.
@@ -199,7 +199,7 @@ class Event:
         return list(EventType)
 
 
-@dataclass
+@dataclass(slots=True)
 class MotionEvent(Event):
     # pylint: disable=too-many-instance-attributes
     """
@@ -227,11 +227,13 @@ class MotionEvent(Event):
 
     def __repr__(self) -> str:
         """Return a string representation of the motion event."""
-        base_repr = super().__repr__()
-        return f"{base_repr} device_id={self.device_id} device_name={self.device_name}"
+        return (
+            f"type={self.type} time={self.time} "
+            f"device_id={self.device_id} device_name={self.device_name}"
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class MealDispensedEvent(Event):
     # pylint: disable=too-many-instance-attributes
     """
@@ -260,7 +262,7 @@ class MealDispensedEvent(Event):
     product_ctn: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class MealUpcomingEvent(Event):
     # pylint: disable=too-many-instance-attributes
     """
@@ -290,11 +292,10 @@ class MealUpcomingEvent(Event):
 
     def __repr__(self) -> str:
         """Return a string representation of the meal upcoming event."""
-        base_repr = super().__repr__()
-        return f"{base_repr} meal_name={self.meal_name}"
+        return f"type={self.type} time={self.time} meal_name={self.meal_name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class FoodLevelLowEvent(Event):
     """
     Represents a low food level event in the PetsSeries system.
@@ -317,11 +318,13 @@ class FoodLevelLowEvent(Event):
 
     def __repr__(self) -> str:
         """Return a string representation of the food level low event."""
-        base_repr = super().__repr__()
-        return f"{base_repr} device_id={self.device_id} device_name={self.device_name}"
+        return (
+            f"type={self.type} time={self.time} "
+            f"device_id={self.device_id} device_name={self.device_name}"
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class MealEnabledEvent(Event):
     # pylint: disable=too-many-instance-attributes
     """
@@ -353,9 +356,8 @@ class MealEnabledEvent(Event):
 
     def __repr__(self) -> str:
         """Return a string representation of the meal enabled event."""
-        base_repr = super().__repr__()
         return (
-            f"{base_repr} "
+            f"type={self.type} time={self.time} "
             f"meal_amount={self.meal_amount} "
             f"meal_time={self.meal_time} "
             f"device_id={self.device_id} "
@@ -363,7 +365,7 @@ class MealEnabledEvent(Event):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterReplacementDueEvent(Event):
     """
     Represents a filter replacement due event in the PetsSeries system.
@@ -386,11 +388,13 @@ class FilterReplacementDueEvent(Event):
 
     def __repr__(self) -> str:
         """Return a string representation of the filter replacement due event."""
-        base_repr = super().__repr__()
-        return f"{base_repr} device_id={self.device_id} device_name={self.device_name}"
+        return (
+            f"type={self.type} time={self.time} "
+            f"device_id={self.device_id} device_name={self.device_name}"
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class FoodOutletStuckEvent(Event):
     """
     Represents a food outlet stuck event in the PetsSeries system.
@@ -413,11 +417,13 @@ class FoodOutletStuckEvent(Event):
 
     def __repr__(self) -> str:
         """Return a string representation of the food outlet stuck event."""
-        base_repr = super().__repr__()
-        return f"{base_repr} device_id={self.device_id} device_name={self.device_name}"
+        return (
+            f"type={self.type} time={self.time} "
+            f"device_id={self.device_id} device_name={self.device_name}"
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceOnlineEvent(Event):
     """
     Represents a device online event in the PetsSeries system.
@@ -440,11 +446,13 @@ class DeviceOnlineEvent(Event):
 
     def __repr__(self) -> str:
         """Return a string representation of the device online event."""
-        base_repr = super().__repr__()
-        return f"{base_repr} device_id={self.device_id} device_name={self.device_name}"
+        return (
+            f"type={self.type} time={self.time} "
+            f"device_id={self.device_id} device_name={self.device_name}"
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceOfflineEvent(Event):
     """
     Represents a device offline event in the PetsSeries system.
@@ -467,5 +475,7 @@ class DeviceOfflineEvent(Event):
 
     def __repr__(self) -> str:
         """Return a string representation of the device offline event."""
-        base_repr = super().__repr__()
-        return f"{base_repr} device_id={self.device_id} device_name={self.device_name}"
+        return (
+            f"type={self.type} time={self.time} "
+            f"device_id={self.device_id} device_name={self.device_name}"
+        )
@@ -1,16 +1,189 @@
-""" 
-Helper function to create an SSL context using certifi's CA bundle in a separate thread.
+"""
+Helper functions for the HTTP session: session and SSL context creation, JSON
+(de)serialization and request error logging.
 """
 
 import asyncio
 import ssl
 import logging
+from contextlib import contextmanager, suppress
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any, Dict, Iterator, Mapping
 
+import aiohttp
 import certifi
+import orjson
+from yarl import URL
+
+from .circuit_breaker import ServiceUnavailableError
+from .config import Config
 
 _LOGGER = logging.getLogger(__name__)
 
+# Only advertise Brotli when aiohttp has a decoder for it
+ACCEPT_ENCODING = (
+    "gzip, br" if find_spec("brotli") or find_spec("brotlicffi") else "gzip"
+)
+
+# Only ask aiohttp to clean up closed SSL transports on Python versions that leak
+# them; it deprecates the flag elsewhere. Older aiohttp lacks the constant.
+_CLEANUP_CLOSED = getattr(aiohttp.connector, "NEEDS_CLEANUP_CLOSED", True)
+
+# The warm-up request must not hold up initialization on a slow backend
+_WARM_UP_TIMEOUT = aiohttp.ClientTimeout(total=2.0)
+
+# SSL contexts shared by every session in the process, keyed by CA bundle path
+_SSL_CONTEXTS: Dict[str, ssl.SSLContext] = {}
+
+
+async def get_ssl_context() -> ssl.SSLContext:
+    """
+    Get the process-wide SSL context using certifi's CA bundle.
+
+    The bundle is loaded in a separate thread the first time only.
+    """
+    cafile = certifi.where()
+    context = _SSL_CONTEXTS.get(cafile)
+    if context is None:
+        context = await asyncio.to_thread(ssl.create_default_context, cafile=cafile)
+        context = _SSL_CONTEXTS.setdefault(cafile, context)
+    return context
+
+
+async def create_session(
+    config: Config, timeout: aiohttp.ClientTimeout
+) -> aiohttp.ClientSession:
+    """
+    Create a ClientSession using certifi's CA bundle and the pool settings of config.
+
+    The session serializes ``json=`` request bodies with orjson.
+    """
+    connector = aiohttp.TCPConnector(
+        ssl=await get_ssl_context(),
+        limit=config.connector_limit,
+        limit_per_host=config.connector_limit_per_host,
+        keepalive_timeout=config.keepalive_timeout,
+        use_dns_cache=True,
+        ttl_dns_cache=config.dns_cache_ttl,
+        enable_cleanup_closed=_CLEANUP_CLOSED,
+        force_close=False,
+    )
+    return aiohttp.ClientSession(
+        timeout=timeout, connector=connector, json_serialize=json_serialize
+    )
+
+
+async def warm_up_connection(
+    session: aiohttp.ClientSession, url: str, headers: Mapping[str, str]
+) -> None:
+    """
+    Open a pooled connection to url so the first API call skips TCP/TLS setup.
+
+    This is best effort and gives up after a couple of seconds; failures are
+    ignored and surface on the real request.
+    """
+    with suppress(aiohttp.ClientError, asyncio.TimeoutError):
+        async with session.head(url, headers=headers, timeout=_WARM_UP_TIMEOUT):
+            _LOGGER.debug("Warmed up connection to %s", url)
+
+
+@lru_cache(maxsize=128)
+def home_url(base: URL, home_id: str, *path: str) -> URL:
+    """
+    Build the URL of a home-scoped resource, e.g. home_url(base, home.id, "meals").
+
+    Results are memoized, as the same few URLs are requested over and over.
+    """
+    url = base / home_id
+    for segment in path:
+        url /= segment
+    return url
+
+
+async def handle_unexpected_response(
+    logger: logging.Logger, response: aiohttp.ClientResponse
+) -> None:
+    """
+    Handle a response whose status the caller did not expect.
+
+    Error statuses raise aiohttp.ClientResponseError, which log_request_errors
+    logs once; the body is only read when DEBUG logging is enabled.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Unexpected response %s from %s: %s",
+            response.status,
+            response.url,
+            await response.text(),
+        )
+    if response.ok:
+        logger.error(
+            "Unexpected response status %s from %s", response.status, response.url
+        )
+    response.raise_for_status()
+
+
+@contextmanager
+def log_request_errors(
+    logger: logging.Logger, operation: str, *args: Any
+) -> Iterator[None]:
+    """
+    Log errors raised while performing an API operation and re-raise them.
+
+    Args:
+        logger (logging.Logger): The logger of the calling module.
+        operation (str): A %-style description of the operation, e.g. "delete meal %s".
+        *args: Arguments for the operation description.
+    """
+    try:
+        yield
+    except aiohttp.ClientResponseError as e:
+        logger.error("Failed to %s: %s %s", operation % args, e.status, e.message)
+        raise
+    except ServiceUnavailableError:
+        # The breaker already warned when it opened; don't log every rejection
+        raise
+    except Exception as e:
+        logger.error("Unexpected error while trying to %s: %s", operation % args, e)
+        raise
+
+
+json_loads = orjson.loads
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes."""
+    return orjson.dumps(obj)
+
+
+def json_serialize(obj: Any) -> str:
+    """Serialize an object to a JSON string, as expected by aiohttp's json_serialize."""
+    return orjson.dumps(obj).decode("utf-8")
+
+
+async def read_json(response: aiohttp.ClientResponse) -> Any:
+    """
+    Read and decode a JSON response body.
+
+    Behaves like ClientResponse.json(loads=json_loads), but hands the raw bytes
+    to the decoder instead of decoding them to a str first.
 
-async def create_ssl_context() -> ssl.SSLContext:
-    """Create an SSL context using certifi's CA bundle in a separate thread."""
-    return await asyncio.to_thread(ssl.create_default_context, cafile=certifi.where())
+    Raises:
+        aiohttp.ContentTypeError: If the response is not JSON.
+    """
+    if "json" not in response.content_type:
+        raise aiohttp.ContentTypeError(
+            response.request_info,
+            response.history,
+            status=response.status,
+            message=(
+                f"Attempt to decode JSON with unexpected mimetype: "
+                f"{response.content_type}"
+            ),
+            headers=response.headers,
+        )
+    body = await response.read()
+    if not body or body.isspace():
+        return None
+    return json_loads(body)
@@ -0,0 +1,218 @@
+"""
+Transport for API requests: the concurrency limit, the circuit breaker and
+retries of idempotent GET requests.
+"""
+
+import asyncio
+import logging
+import random
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Iterator,
+    Mapping,
+    Optional,
+    Union,
+)
+
+import aiohttp
+from yarl import URL
+
+from .circuit_breaker import CircuitBreaker
+from .config import Config
+from .session import read_json
+
+_LOGGER = logging.getLogger(__name__)
+
+# Retry policy for idempotent GET requests
+_GET_ATTEMPTS = 4
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_BASE_DELAY = 0.25
+_RETRY_MAX_DELAY = 4.0
+_RETRY_AFTER_MAX = 30.0
+
+
+@contextmanager
+def breaker_guard(
+    breaker: CircuitBreaker,
+) -> Iterator[Callable[[aiohttp.ClientResponse], None]]:
+    """
+    Admit one logical call through the circuit breaker and record its outcome once.
+
+    Yields a function to call with the final response: statuses below 500 count
+    as a success, 5xx as a failure. Connection errors and timeouts raised before
+    that count as a failure; a call left without an outcome, e.g. because it was
+    cancelled, is released.
+
+    Raises:
+        ServiceUnavailableError: If the breaker is open.
+    """
+    breaker.before()
+    recorded = False
+
+    def record(response: aiohttp.ClientResponse) -> None:
+        nonlocal recorded
+        if response.status < 500:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        recorded = True
+
+    try:
+        yield record
+    except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+        if not recorded:
+            breaker.record_failure()
+            recorded = True
+        raise
+    finally:
+        if not recorded:
+            breaker.release()
+
+
+def _ignore_outcome(_response: aiohttp.ClientResponse) -> None:
+    """Stand-in for breaker_guard's record function on calls it does not guard."""
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to wait before the next attempt: the server's Retry-After when given
+    in seconds, otherwise exponential backoff with full jitter.
+    """
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), _RETRY_AFTER_MAX)
+        except ValueError:
+            pass
+    return random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2**attempt))
+
+
+class ApiTransport:
+    """
+    Sends authenticated requests to the PetsSeries backend.
+
+    At most Config.max_concurrent_requests requests are in flight at once;
+    further callers wait for a slot. A circuit breaker makes requests to the
+    Config.base_url host fail fast while the backend is down; other hosts,
+    such as the account endpoints, do not affect it. Idempotent GETs are retried.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        get_session: Callable[[], Awaitable[aiohttp.ClientSession]],
+        headers: Mapping[str, str],
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            config (Config): Supplies the concurrency and circuit breaker limits.
+            get_session: Returns the session to use, refreshing the token if needed.
+            headers (Mapping[str, str]): Default request headers; kept by
+                reference, so later updates to the mapping apply.
+        """
+        self._get_session = get_session
+        self.headers = headers
+        self._bulkhead = asyncio.Semaphore(config.max_concurrent_requests)
+        self.breaker = CircuitBreaker(
+            config.breaker_fail_threshold, config.breaker_reset_after
+        )
+        self._breaker_host = URL(config.base_url).host
+
+    def _guard(
+        self, url: Union[str, URL]
+    ) -> ContextManager[Callable[[aiohttp.ClientResponse], None]]:
+        """
+        Guard a call with the circuit breaker if it goes to the PetsSeries backend.
+        """
+        if URL(url).host == self._breaker_host:
+            return breaker_guard(self.breaker)
+        return nullcontext(_ignore_outcome)
+
+    @asynccontextmanager
+    async def _send(
+        self, method: str, url: Union[str, URL], **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Perform a request within the concurrency limit, without the circuit breaker.
+        """
+        session = await self._get_session()
+        kwargs.setdefault("headers", self.headers)
+        async with self._bulkhead:
+            async with session.request(method, url, **kwargs) as response:
+                yield response
+
+    @asynccontextmanager
+    async def request(
+        self, method: str, url: Union[str, URL], **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Perform a request and yield the response.
+
+        Connection errors, timeouts and 5xx responses from the PetsSeries
+        backend count towards the circuit breaker.
+
+        Raises:
+            ServiceUnavailableError: If the circuit breaker is open.
+        """
+        with self._guard(url) as record:
+            async with self._send(method, url, **kwargs) as response:
+                record(response)
+                yield response
+
+    async def get_json(self, url: Union[str, URL]) -> Any:
+        """
+        Perform a GET request and return the decoded JSON body.
+
+        Rate-limited (429) and transient 5xx responses as well as dropped
+        connections are retried a few times with jittered exponential backoff;
+        TLS and certificate errors are raised straight away.
+        The circuit breaker sees the whole exchange as a single call.
+
+        Raises:
+            aiohttp.ClientResponseError: If the final response is an error.
+            ServiceUnavailableError: If the circuit breaker is open.
+        """
+        with self._guard(url) as record:
+            for attempt in range(1, _GET_ATTEMPTS + 1):
+                try:
+                    async with self._send("GET", url) as response:
+                        if (
+                            response.status not in _RETRY_STATUSES
+                            or attempt == _GET_ATTEMPTS
+                        ):
+                            record(response)
+                            response.raise_for_status()
+                            return await read_json(response)
+                        reason = response.status
+                        delay = _retry_delay(
+                            attempt, response.headers.get("Retry-After")
+                        )
+                except (
+                    aiohttp.ClientConnectorCertificateError,
+                    aiohttp.ClientSSLError,
+                ):
+                    # TLS and certificate failures will not go away on retry
+                    raise
+                except (
+                    aiohttp.ServerDisconnectedError,
+                    aiohttp.ClientConnectorError,
+                ) as e:
+                    if attempt == _GET_ATTEMPTS:
+                        raise
+                    reason = e
+                    delay = _retry_delay(attempt)
+                _LOGGER.debug(
+                    "Retrying GET %s in %.2fs after %s (attempt %d/%d)",
+                    url,
+                    delay,
+                    reason,
+                    attempt,
+                    _GET_ATTEMPTS,
+                )
+                await asyncio.sleep(delay)
@@ -11,7 +11,12 @@ setup(
     author="AboveColin",
     author_email="colin@cdevries.dev",
     packages=["petsseries"],
-    install_requires=["aiohttp", "aiofiles", "certifi", "PyJWT", "tinytuya"],
+    install_requires=["aiohttp", "aiofiles", "certifi", "orjson", "PyJWT", "tinytuya"],
+    extras_require={
+        "streaming": ["ijson>=3.1"],
+        "brotli": ["Brotli"],
+        "speedups": ["aiohttp[speedups]"],
+    },
     python_requires=">=3.11",
     url="https://github.com/abovecolin/petsseries",
     classifiers=[